@@ -1,5 +1,5 @@
 """Network enumeration for IPv4 and IPv6 addresses."""
 
-from .core import aionetenum, netenum
+from .core import aionetenum, netenum, netenum_array, netenum_to_file, netenum_to_file_parallel
 
-__all__ = ["netenum", "aionetenum"]
+__all__ = ["netenum", "aionetenum", "netenum_to_file", "netenum_to_file_parallel", "netenum_array"]
@@ -6,11 +6,10 @@ allowing users to enumerate IP addresses from CIDR ranges provided via stdin.
 """
 
 import argparse
-import random
 import sys
 from typing import List
 
-from .core import netenum
+from .core import netenum_to_file, netenum_to_file_parallel
 
 
 def get_cidrs_from_stdin() -> List[str]:
@@ -31,7 +30,25 @@ def main() -> None:
         action="store_true",
         help="Output addresses in random order",
     )
+    parser.add_argument(
+        "-u",
+        "--unordered",
+        action="store_true",
+        help="Output each network in turn instead of striping, formatting in parallel worker processes",
+    )
+    parser.add_argument(
+        "-w",
+        "--workers",
+        type=int,
+        help="Number of worker processes for --unordered (default: number of CPUs)",
+    )
     args = parser.parse_args()
+    if args.unordered and args.random:
+        parser.error("--unordered cannot be combined with --random")
+    if args.workers is not None and not args.unordered:
+        parser.error("--workers requires --unordered")
+    if args.workers is not None and args.workers < 1:
+        parser.error("--workers must be at least 1")
 
     try:
         cidrs = get_cidrs_from_stdin()
@@ -39,16 +56,12 @@ def main() -> None:
             sys.stderr.write("Error: No CIDR ranges provided.\nPipe CIDR ranges to stdin, one per line.\n")
             sys.exit(1)
 
-        # Get all addresses
-        addresses = list(netenum(cidrs))
-
-        # If random flag is set, shuffle the addresses
-        if args.random:
-            random.shuffle(addresses)
-
-        # Print addresses one per line
-        for addr in addresses:
-            sys.stdout.write(f"{addr}\n")
+        # Stream blocks of pre-formatted addresses straight to stdout
+        sys.stdout.flush()
+        if args.unordered:
+            netenum_to_file_parallel(cidrs, sys.stdout.buffer, workers=args.workers)
+        else:
+            netenum_to_file(cidrs, sys.stdout.buffer, randomize=args.random)
 
     except KeyboardInterrupt:
         sys.exit(0)
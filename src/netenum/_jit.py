@@ -0,0 +1,86 @@
+"""Numba-compiled kernels for bulk address formatting.
+
+This module is optional: it requires numba (and numpy), so callers must import it
+lazily and fall back to the pure-Python formatters when the import fails.
+"""
+
+from typing import Callable, Iterable
+
+import numba
+import numpy as np
+
+# Upper bound on the ASCII length of one IPv4 address plus its newline
+IPV4_LINE_MAX = 16
+
+# ASCII digits of every octet value followed by a dot, padded to 4 bytes, and the
+# length of each entry including the dot, indexed by value
+OCTET_DIGITS = np.zeros((256, 4), dtype=np.uint8)
+OCTET_LENGTHS = np.zeros(256, dtype=np.int64)
+for _octet in range(256):
+    _digits = str(_octet).encode("ascii") + b"."
+    OCTET_DIGITS[_octet, : len(_digits)] = np.frombuffer(_digits, dtype=np.uint8)
+    OCTET_LENGTHS[_octet] = len(_digits)
+
+
+@numba.njit(cache=True, nogil=True)
+def fill_ipv4_ascii(start: int, end: int, out: np.ndarray, pos: int) -> int:
+    """
+    Write the IPv4 addresses in [start, end) as newline-terminated ASCII into out.
+
+    Each octet is copied as a fixed 4-byte row of the OCTET_DIGITS lookup table
+    rather than divided into digits. Addresses are written from offset pos,
+    which must leave room for IPV4_LINE_MAX bytes per address. Arithmetic is
+    done in int64 so that an exclusive end of 2**32 does not overflow. The GIL
+    is released while running.
+
+    Args:
+        start: First address as an integer
+        end: One past the last address as an integer
+        out: Contiguous uint8 output buffer
+        pos: Offset in out to start writing at
+
+    Returns:
+        int: Offset in out just past the last byte written
+    """
+    for x in range(start, end):
+        for shift in (24, 16, 8, 0):
+            octet = (x >> shift) & 0xFF
+            out[pos] = OCTET_DIGITS[octet, 0]
+            out[pos + 1] = OCTET_DIGITS[octet, 1]
+            out[pos + 2] = OCTET_DIGITS[octet, 2]
+            out[pos + 3] = OCTET_DIGITS[octet, 3]
+            pos += OCTET_LENGTHS[octet]
+        # Replace the dot after the last octet with the line terminator
+        out[pos - 1] = 10
+    return pos
+
+
+def write_ipv4_ranges(ranges: Iterable[range], write: Callable[[bytes], object], buffer_size: int) -> None:
+    """
+    Format IPv4 address ranges with fill_ipv4_ascii and pass the output to write.
+
+    Each kernel call fills the remaining buffer, so write is called with roughly
+    buffer_size bytes at a time. The buffer is reused, so write receives a copy of
+    its contents that stays valid after the call.
+
+    Args:
+        ranges: Iterable of integer address ranges, written in order
+        write: Callable accepting a bytes-like object
+        buffer_size: Approximate number of bytes to accumulate per write call
+    """
+    out = np.empty(max(buffer_size, IPV4_LINE_MAX), dtype=np.uint8)
+    view = out.data
+    pos = 0
+    for addresses in ranges:
+        first, end = addresses.start, addresses.stop
+        while first < end:
+            count = (len(out) - pos) // IPV4_LINE_MAX
+            if count == 0:
+                write(bytes(view[:pos]))
+                pos = 0
+                continue
+            last = min(first + count, end)
+            pos = int(fill_ipv4_ascii(np.int64(first), np.int64(last), out, np.int64(pos)))
+            first = last
+    if pos:
+        write(bytes(view[:pos]))
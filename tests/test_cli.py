@@ -71,3 +71,35 @@ def test_main_empty_input(capsys) -> None:
     assert exc_info.value.code == 1
     captured = capsys.readouterr()
     assert "Error: No CIDR ranges provided" in captured.err
+
+
+def test_main_chunked_output(capsys) -> None:
+    """Test output spanning several write chunks."""
+    input_data = "10.0.0.0/16\n"
+    expected = "".join(f"{ipaddress.IPv4Address(addr)}\n" for addr in range(0x0A000000, 0x0A010000))
+    with patch("sys.stdin", io.StringIO(input_data)), patch("sys.argv", ["netenum"]):
+        main()
+        assert capsys.readouterr().out == expected
+
+
+def test_main_unordered_workers(capsys) -> None:
+    """Test parallel unordered output, which writes each network in turn."""
+    input_data = "10.0.0.0/14\n192.168.0.0/30\n"
+    expected = "".join(f"{addr}\n" for cidr in input_data.split() for addr in ipaddress.ip_network(cidr))
+    with patch("sys.stdin", io.StringIO(input_data)), patch("sys.argv", ["netenum", "--unordered", "--workers", "2"]):
+        main()
+        assert capsys.readouterr().out == expected
+
+
+def test_main_workers_requires_unordered() -> None:
+    """Test that --workers without --unordered is a usage error."""
+    with patch("sys.argv", ["netenum", "--workers", "2"]), pytest.raises(SystemExit) as exc:
+        main()
+    assert exc.value.code == 2
+
+
+def test_main_workers_must_be_positive() -> None:
+    """Test that a worker count below one is a usage error."""
+    with patch("sys.argv", ["netenum", "--unordered", "--workers", "0"]), pytest.raises(SystemExit) as exc:
+        main()
+    assert exc.value.code == 2
@@ -1,10 +1,30 @@
 """Test suite for the core network enumeration functionality."""
 
+import asyncio
+import gzip
+import io
 import ipaddress
+import os
+import random
 
 import pytest
 
-from netenum.core import NetworkEnumerator, determine_partition_size
+from netenum import core
+from netenum.core import (
+    ASYNC_YIELD_INTERVAL,
+    FAMILY_IPV4,
+    FAMILY_IPV6,
+    NetworkEnumerator,
+    _format_ipv4_array,
+    _ipv6_array,
+    _parse_cidr,
+    _v6_to_str,
+    determine_partition_size,
+    netenum_array,
+    netenum_to_file,
+    netenum_to_file_parallel,
+    write_chunks,
+)
 
 
 def test_ipv4_enumeration() -> None:
@@ -128,3 +148,328 @@ def test_memory_stability() -> None:
             break
 
     assert count == 50000
+
+
+def test_string_output() -> None:
+    """Test enumeration yielding pre-formatted address strings."""
+    cidrs = ["192.168.0.0/30", "2001:db8::/126"]
+    addresses = list(NetworkEnumerator(cidrs, output="str"))
+    assert addresses == [
+        "192.168.0.0",
+        "2001:db8::",
+        "192.168.0.1",
+        "2001:db8::1",
+        "192.168.0.2",
+        "2001:db8::2",
+        "192.168.0.3",
+        "2001:db8::3",
+    ]
+
+
+def test_string_output_ipv6_compression() -> None:
+    """Test that string output matches ipaddress formatting for IPv6 zero runs."""
+    samples = [
+        "::",
+        "::1",
+        "1::",
+        "2001:db8::1:0:0:1",
+        "2001:0:0:1::1",
+        "1:0:1:0:1:0:1:0",
+        "fe80::1:2:3:4",
+        "1:2:3:4:5:6:7:8",
+        "::ffff:1.2.3.4",
+        "::ffff:1:0:0",
+    ]
+    for sample in samples:
+        addr = ipaddress.IPv6Address(sample)
+        assert _v6_to_str(int(addr)) == str(addr)
+
+
+@pytest.mark.parametrize("dotted, expected", [(True, "::ffff:1.2.3.4"), (False, "::ffff:102:304")])
+def test_string_output_ipv4_mapped(monkeypatch, dotted, expected) -> None:
+    """Test both ipaddress styles of formatting IPv4-mapped addresses."""
+    monkeypatch.setattr(core, "_V4_MAPPED_DOTTED", dotted)
+    assert _v6_to_str(int(ipaddress.IPv6Address("::ffff:1.2.3.4"))) == expected
+
+
+def test_invalid_output_mode() -> None:
+    """Test handling of unknown output modes."""
+    with pytest.raises(ValueError):
+        NetworkEnumerator(["192.168.0.0/24"], output="invalid")
+
+
+def test_chunks() -> None:
+    """Test block output matches per-address enumeration order."""
+    for cidrs in (["10.0.0.0/20"], ["10.0.0.0/22", "2001:db8::/118", "192.168.0.0/30"]):
+        expected = b"".join(addr + b"\n" for addr in NetworkEnumerator(cidrs, output="bytes"))
+        chunks = list(NetworkEnumerator(cidrs, output="bytes").chunks(max_addresses=1000))
+        assert all(chunk.count(b"\n") <= 1000 for chunk in chunks)
+        assert b"".join(chunks) == expected
+
+
+def test_chunks_requires_bytes_output() -> None:
+    """Test that block output is only available in bytes mode."""
+    with pytest.raises(ValueError):
+        next(NetworkEnumerator(["192.168.0.0/24"]).chunks())
+
+
+def test_bytes_output() -> None:
+    """Test that bytes output matches ipaddress formatting."""
+    cidrs = ["0.0.0.0/22", "255.255.252.0/22", "2001:db8::/118"]
+    expected = [str(addr).encode("ascii") for addr in NetworkEnumerator(cidrs)]
+    assert list(NetworkEnumerator(cidrs, output="bytes")) == expected
+
+
+@pytest.mark.parametrize("cidrs", [["192.168.0.0/22", "2001:db8::/120"], ["255.255.0.0/16"], ["2001:db8::/112"]])
+def test_netenum_to_file(cidrs) -> None:
+    """Test writing enumerated addresses to a binary file object."""
+    out = io.BytesIO()
+    netenum_to_file(cidrs, out)
+    assert out.getvalue() == b"".join(f"{addr}\n".encode("ascii") for addr in NetworkEnumerator(cidrs))
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_netenum_to_file_parallel(workers) -> None:
+    """Test that parallel output writes each network in full, in order."""
+    cidrs = ["10.0.0.0/13", "2001:db8::/112", "192.168.0.0/24"]
+    out = io.BytesIO()
+    netenum_to_file_parallel(cidrs, out, workers=workers)
+    expected = "".join(f"{addr}\n" for cidr in cidrs for addr in ipaddress.ip_network(cidr))
+    assert out.getvalue() == expected.encode("ascii")
+
+
+def test_netenum_to_file_parallel_invalid_workers() -> None:
+    """Test that a worker count below one is rejected."""
+    with pytest.raises(ValueError):
+        netenum_to_file_parallel(["10.0.0.0/24"], io.BytesIO(), workers=0)
+
+
+def test_jit_ipv4_kernel() -> None:
+    """Test the optional Numba IPv4 kernel against ipaddress formatting."""
+    jit = pytest.importorskip("netenum._jit")
+    out = io.BytesIO()
+    ranges = [range(0, 300), range(0xFFFFFF00, 0x100000000)]
+    jit.write_ipv4_ranges(ranges, out.write, 4096)
+    expected = "".join(f"{ipaddress.IPv4Address(addr)}\n" for r in ranges for addr in r)
+    assert out.getvalue() == expected.encode("ascii")
+
+
+def test_repeated_iteration() -> None:
+    """Test that each iteration over an enumerator starts from the beginning."""
+    enumerator = NetworkEnumerator(["192.168.0.0/24", "2001:db8::/120"])
+    assert list(enumerator) == list(enumerator)
+    assert len(list(enumerator)) == 512
+
+
+@pytest.mark.parametrize("cidr", ["10.0.0.1/32", "10.0.0.0/31", "10.0.0.0/29", "10.0.0.0/22", "2001:db8::/118"])
+def test_random_permutation(cidr) -> None:
+    """Test that randomized enumeration yields every address exactly once."""
+    addresses = list(NetworkEnumerator([cidr], randomize=True))
+    assert sorted(addresses) == list(ipaddress.ip_network(cidr))
+
+
+def test_random_order() -> None:
+    """Test that randomized enumeration changes the order while keeping the striping."""
+    random.seed(0)
+    cidrs = ["10.0.0.0/16", "2001:db8::/112"]
+    addresses = list(NetworkEnumerator(cidrs, randomize=True))
+    v4 = addresses[0::2]
+    assert all(isinstance(addr, ipaddress.IPv4Address) for addr in v4)
+    assert all(isinstance(addr, ipaddress.IPv6Address) for addr in addresses[1::2])
+    assert v4 != sorted(v4)
+    assert sorted(v4) == list(ipaddress.ip_network(cidrs[0]))
+
+
+def test_partition_sizes_large_ipv6() -> None:
+    """Test partition sizes for IPv6 networks too large to represent exactly as floats."""
+    for cidr in ("2001:db8::/64", "2000::/3", "::/0"):
+        assert determine_partition_size(ipaddress.ip_network(cidr)) == 1048576
+
+
+@pytest.mark.asyncio
+async def test_async_mixed_enumeration() -> None:
+    """Test asynchronous enumeration stripes across multiple networks like sync iteration."""
+    cidrs = ["192.168.0.0/24", "2001:db8::/124", "10.0.0.0/30"]
+    addresses = [addr async for addr in NetworkEnumerator(cidrs)]
+    assert addresses == list(NetworkEnumerator(cidrs))
+
+
+@pytest.mark.asyncio
+async def test_async_cooperative_yield() -> None:
+    """Test that asynchronous enumeration still lets other tasks run."""
+    ticks = 0
+
+    async def ticker() -> None:
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0)
+
+    task = asyncio.ensure_future(ticker())
+    count = 0
+    async for _ in NetworkEnumerator(["10.0.0.0/16"]):
+        count += 1
+    task.cancel()
+    assert count == 65536
+    assert ticks >= 65536 // ASYNC_YIELD_INTERVAL - 1
+
+
+def test_netenum_array() -> None:
+    """Test NumPy array enumeration of IPv4 and IPv6 networks."""
+    np = pytest.importorskip("numpy")
+    cidrs = ["10.0.0.0/22", "2001:db8::/120"]
+    arrays = list(netenum_array(cidrs, chunk=300))
+    assert [len(arr) for arr in arrays] == [300, 256, 300, 300, 124]
+    v4 = np.concatenate([arr for arr in arrays if arr.dtype == np.uint32])
+    assert v4.tolist() == [int(addr) for addr in ipaddress.ip_network(cidrs[0])]
+    v6 = np.concatenate([arr for arr in arrays if arr.dtype != np.uint32])
+    assert [(hi << 64) | lo for hi, lo in v6.tolist()] == [int(addr) for addr in ipaddress.ip_network(cidrs[1])]
+
+
+def test_ipv6_array_carry() -> None:
+    """Test that IPv6 arrays carry into the high half when the low half wraps."""
+    np = pytest.importorskip("numpy")
+    arr = _ipv6_array(np, (1 << 64) - 2, (1 << 64) + 2)
+    assert [(hi << 64) | lo for hi, lo in arr.tolist()] == list(range((1 << 64) - 2, (1 << 64) + 2))
+
+
+def test_format_ipv4_array() -> None:
+    """Test vectorized IPv4 formatting against ipaddress formatting."""
+    np = pytest.importorskip("numpy")
+    addresses = np.concatenate(
+        [np.arange(0, 1100, dtype=np.uint32), np.arange(0xFFFFFF00, 0x100000000, dtype=np.uint32)]
+    )
+    expected = "".join(f"{ipaddress.IPv4Address(int(addr))}\n" for addr in addresses)
+    assert _format_ipv4_array(np, addresses).tobytes() == expected.encode("ascii")
+
+
+def test_netenum_to_file_skips_fast_paths_below_threshold(monkeypatch) -> None:
+    """Test that networks below NUMPY_MIN_ADDRESSES never pay for importing numpy or numba."""
+
+    def fail() -> None:
+        raise AssertionError("optional formatters should not be loaded")
+
+    monkeypatch.setattr(core, "_load_jit", fail)
+    monkeypatch.setattr(core, "_load_numpy", fail)
+    out = io.BytesIO()
+    netenum_to_file(["10.0.0.0/16"], out)
+    assert out.getvalue() == "".join(f"{addr}\n" for addr in ipaddress.ip_network("10.0.0.0/16")).encode("ascii")
+
+
+def test_netenum_to_file_prefers_numpy_below_jit_threshold(monkeypatch) -> None:
+    """Test that NumPy is picked over an installed Numba for networks below JIT_MIN_ADDRESSES."""
+    jit = pytest.importorskip("netenum._jit")
+    monkeypatch.setattr(core, "NUMPY_MIN_ADDRESSES", 0)
+    monkeypatch.setattr(core, "JIT_MIN_ADDRESSES", 1 << 32)
+    monkeypatch.setattr(jit, "write_ipv4_ranges", None)
+    out = io.BytesIO()
+    netenum_to_file(["10.0.0.0/16"], out)
+    assert out.getvalue() == "".join(f"{addr}\n" for addr in ipaddress.ip_network("10.0.0.0/16")).encode("ascii")
+
+
+def test_netenum_to_file_numpy(monkeypatch) -> None:
+    """Test the NumPy formatting path of netenum_to_file when numba is unavailable."""
+    pytest.importorskip("numpy")
+    monkeypatch.setattr(core, "_load_jit", lambda: None)
+    monkeypatch.setattr(core, "NUMPY_MIN_ADDRESSES", 0)
+    out = io.BytesIO()
+    netenum_to_file(["255.254.0.0/15"], out)
+    assert out.getvalue() == "".join(f"{addr}\n" for addr in ipaddress.ip_network("255.254.0.0/15")).encode("ascii")
+
+
+@pytest.mark.parametrize(
+    "cidr",
+    [
+        "10.0.0.0/8",
+        "10.0.0.1",
+        "0.0.0.0/0",
+        "10.0.0.0/255.0.0.0",
+        "2001:DB8::/32",
+        "::ffff:1.2.3.4/128",
+        "::/0",
+    ],
+)
+def test_parse_cidr(cidr) -> None:
+    """Test that the fast CIDR parser agrees with ipaddress."""
+    network = ipaddress.ip_network(cidr)
+    family = FAMILY_IPV6 if network.version == 6 else FAMILY_IPV4
+    assert _parse_cidr(cidr) == (int(network.network_address), network.num_addresses, family)
+
+
+@pytest.mark.parametrize(
+    "cidr", ["10.0.0.1/8", "10.0.0.0/33", "10.0.0.0/", "10.0.0.0/+8", "01.0.0.0/8", "1.2.3", "2001:db8::1/32", "::/129"]
+)
+def test_parse_cidr_invalid(cidr) -> None:
+    """Test that the fast CIDR parser rejects what ipaddress rejects."""
+    with pytest.raises(ValueError):
+        _parse_cidr(cidr)
+
+
+class _RetainingShortWriter(io.RawIOBase):
+    """Writer without a file descriptor that keeps every object it is given and accepts at most 1000 bytes per call."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.writes = []
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        written = min(len(data), 1000)
+        self.writes.append((data, written))
+        return written
+
+    def getvalue(self) -> bytes:
+        return b"".join(bytes(data)[:written] for data, written in self.writes)
+
+
+@pytest.mark.parametrize("fast_path", ["jit", "numpy", None])
+def test_netenum_to_file_retaining_short_writer(monkeypatch, fast_path) -> None:
+    """Test that output survives writers that keep their argument and write only part of it."""
+    if fast_path == "jit":
+        pytest.importorskip("netenum._jit")
+        monkeypatch.setattr(core, "JIT_MIN_ADDRESSES", 0)
+    else:
+        monkeypatch.setattr(core, "_load_jit", lambda: None)
+        if fast_path == "numpy":
+            pytest.importorskip("numpy")
+            monkeypatch.setattr(core, "NUMPY_MIN_ADDRESSES", 0)
+        else:
+            monkeypatch.setattr(core, "_load_numpy", lambda: None)
+    out = _RetainingShortWriter()
+    netenum_to_file(["10.0.0.0/15"], out)
+    assert out.getvalue() == "".join(f"{addr}\n" for addr in ipaddress.ip_network("10.0.0.0/15")).encode("ascii")
+
+
+def test_write_chunks_writev(tmp_path) -> None:
+    """Test scatter-gather writes to a real file descriptor."""
+    cidrs = ["10.0.0.0/16", "2001:db8::/112", "192.168.0.0/24"]
+    path = tmp_path / "out.txt"
+    with open(path, "wb") as fileobj:
+        fileobj.write(b"header\n")
+        write_chunks(NetworkEnumerator(cidrs, output="bytes").chunks(), fileobj)
+    expected = b"header\n" + b"".join(addr + b"\n" for addr in NetworkEnumerator(cidrs, output="bytes"))
+    assert path.read_bytes() == expected
+
+
+def test_netenum_to_file_gzip(tmp_path) -> None:
+    """Test that wrappers reporting the underlying descriptor still get their own write called."""
+    cidrs = ["10.0.0.0/24", "192.168.0.0/30"]
+    path = tmp_path / "out.gz"
+    with gzip.open(path, "wb") as fileobj:
+        netenum_to_file(cidrs, fileobj)
+    with gzip.open(path, "rb") as fileobj:
+        assert fileobj.read() == b"".join(addr + b"\n" for addr in NetworkEnumerator(cidrs, output="bytes"))
+
+
+def test_write_chunks_partial_writev(tmp_path, monkeypatch) -> None:
+    """Test that short scatter-gather writes are completed."""
+    if not hasattr(os, "writev"):
+        pytest.skip("os.writev not available")
+    monkeypatch.setattr(os, "writev", lambda fd, blocks: os.write(fd, blocks[0][:3]))
+    chunks = [b"10.0.0.0\n", b"10.0.0.1\n", b"10.0.0.2\n"]
+    path = tmp_path / "out.txt"
+    with open(path, "wb") as fileobj:
+        write_chunks(chunks, fileobj)
+    assert path.read_bytes() == b"".join(chunks)